@@ -1,6 +1,5 @@
 """Generate a latex table output."""
 
-import itertools
 from typing import Union
 
 from pathlib import Path
@@ -8,14 +7,13 @@ from pathlib import Path
 import numpy as np
 
 
-def _lengths(data):
-    return np.array([len(el) for el in data], dtype=int)
-
-
 class Table:
     """Encapsulates a latex table.
     """
 
+    _cell_separator = " & "
+    _row_end = " \\\\"
+
     def __init__(self,
                  header: list[str],
                  caption: Union[str, None] = None,
@@ -35,11 +33,11 @@ class Table:
         self._headers = header
         self._caption = caption
         self._data: list[list[str]] = []
-        self._column_widths = _lengths(self._headers)
+        self._column_widths = list(map(len, self._headers))
         self._scale = scale
 
         if layout is None:
-            self._layout = np.array(["l"] * self.cols, dtype=str)
+            self._layout = ["l"] * self.cols
         else:
             self.set_layout(layout)
 
@@ -98,13 +96,12 @@ class Table:
         Raises:
             IndexError: _description_
         """
-        cleaned_string = ''.join(itertools.chain(*layout_string.split()))
+        cleaned_string = ''.join(layout_string.split())
         if idx is None:
             assert len(cleaned_string) >= self.cols, \
                 "Not enough layout identifiers provided!"
 
-            self._layout = np.array(list(cleaned_string[:self.cols]),
-                                    dtype=str)
+            self._layout = list(cleaned_string[:self.cols])
             return
 
         if idx >= self.cols:
@@ -131,50 +128,57 @@ class Table:
         # TODO: we can do some more sophisticated parsing here
         new_data = list(map(str, row_data))
 
-        self._column_widths = np.max([self._column_widths,
-                                     _lengths(new_data)],
-                                     axis=0)
         self._data.append(new_data)
 
-    def _generate_header(self) -> str:
-        """Generate a latex header string.
-        """
-        result = "\t\t"
-        for idx, header in enumerate(self.headers):
-            result += header.ljust(self._column_widths[idx])
-
-            if idx < self.cols - 1:
-                result += " & "
+    def add_rows(self, rows) -> None:
+        """Add multiple rows at once.
 
-        result += " \\\\"
+        Valid input is any iterable of rows accepted by add_row, or a 2D numpy array
+        with at least self.cols columns. Numeric and unicode numpy arrays are stringified
+        in a single vectorized call instead of per cell, all other input goes through
+        add_row.
 
-        return result
-
-    def _line_to_table_body(self, line: Union[None, list[str]]) -> str:
-        """Generate a single latex table row for a given data entry.
-        If None is given, a separator is inserted.
+        Args:
+            rows (_type_): The rows to add
         """
-        result = "\t\t"
+        if not isinstance(rows, np.ndarray) or rows.dtype.kind not in "biufcU":
+            for row_data in rows:
+                self.add_row(row_data)
+            return
 
-        # Special case, insert a separator
-        if line is None:
-            return result + "\\midrule"
+        assert rows.ndim == 2 and rows.shape[1] >= self.cols, \
+            "Cannot match given row data to available cells!"
 
-        # Convert a valid line into a table body
-        for idx, element in enumerate(line):
-            result += element.ljust(self._column_widths[idx])
+        self._data.extend(rows.astype(str).tolist())
 
-            if idx < self.cols - 1:
-                result += " & "
+    def _update_column_widths(self) -> None:
+        """Recompute the column widths from the headers and all rows in a single pass.
+        """
+        rows = [line for line in self._data if line is not None]
+        self._column_widths = [max(map(len, column))
+                               for column in zip(self._headers, *rows)]
 
-        result += " \\\\"
+    def _compile_row_format(self) -> str:
+        """Compile a format string that renders a padded table row from its cell data.
+        This is shared by the header and all body rows.
+        """
+        return "\t\t" + self._cell_separator.join(
+            f"{{:<{width}}}" for width in self._column_widths) \
+            + self._row_end
 
-        return result
+    def _generate_header(self, row_format: str) -> str:
+        """Generate a latex header string.
+        """
+        return row_format.format(*self.headers)
 
-    def _generate_table_body(self) -> list[str]:
+    def _generate_table_body(self, row_format: str) -> list[str]:
         """Generate the table body (i.e., the cell data of the table).
+        A None-entry in the data is rendered as a separator.
         """
-        return [self._line_to_table_body(line) for line in self.data]
+        render_row = row_format.format
+
+        return ["\t\t\\midrule" if line is None else render_row(*line)
+                for line in self._data]
 
     def _generate_latex(self) -> list[str]:
         """Generate the latex table.
@@ -182,6 +186,9 @@ class Table:
         Returns:
             list[str]: A list containing each line as a string-representation of the table.
         """
+        self._update_column_widths()
+        row_format = self._compile_row_format()
+
         content = [
             "\\begin{table}[h]",
             "\t\\centering",
@@ -189,13 +196,14 @@ class Table:
             f"\t\\label{{tbl:{self.caption.split()[0].lower()}}}",
             f"\t\\begin{{tabularx}}{{{self.scale}\\linewidth}}{{{self.layout}}}",
             "\t\t\\toprule",
-            self._generate_header(),
-            "\t\t\\midrule"] \
-            + self._generate_table_body() + [
+            self._generate_header(row_format),
+            "\t\t\\midrule"]
+        content.extend(self._generate_table_body(row_format))
+        content.extend([
             "\t\t\\bottomrule",
             "\t\\end{tabularx}",
             "\\end{table}"
-        ]
+        ])
 
         return content
 
@@ -208,4 +216,4 @@ class Table:
         content = self._generate_latex()
 
         with open(file_path, "wt", encoding="utf-8") as file:
-            file.writelines('\n'.join(content))
+            file.write('\n'.join(content))